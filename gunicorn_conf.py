@@ -0,0 +1,10 @@
+import os
+
+# Gunicorn configuration for the Salesforce API proxy
+# Every request spends nearly all of its time waiting on Salesforce,
+# so gevent workers multiplex many in-flight requests per process
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+worker_class = 'gevent'
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+worker_connections = int(os.environ.get('WORKER_CONNECTIONS', 1000))
+keepalive = 75
@@ -1,9 +1,27 @@
-from flask import Flask, request, jsonify
+# Patch blocking I/O before anything opens sockets so every outbound
+# Salesforce call yields to other requests under gevent workers
+from gevent import monkey
+monkey.patch_all()
+
+from flask import Flask, Response, request
 from flask_cors import CORS
+from flask_compress import Compress
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.timeout import Timeout
+import orjson
 import os
 import json
 import logging
+import itertools
+import re
+import threading
+import time
+from concurrent.futures import Future
+from functools import lru_cache, wraps
+from cachetools import LRUCache, TTLCache
+from gevent.pool import Pool
 
 # Initialize Flask app
 app = Flask(__name__)
@@ -16,26 +34,226 @@ CORS(app,
      allow_headers=["Content-Type", "Authorization", "X-Requested-With"],
      supports_credentials=False)
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Compress JSON responses to the extension, Salesforce payloads shrink 5-10x.
+# Streamed query results are compressed chunk by chunk as they pass through.
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_ALGORITHM_STREAMING'] = ['br', 'deflate']
+app.config['COMPRESS_MIN_SIZE'] = 500
+app.config['COMPRESS_LEVEL'] = 4
+app.config['COMPRESS_BR_LEVEL'] = 4
+Compress(app)
+
+# Configure logging, LOG_LEVEL=WARNING keeps per-request logging off the hot path.
+# An unknown level falls back to INFO rather than stopping the app from starting.
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
+LOG_LEVEL_VALID = isinstance(logging.getLevelName(LOG_LEVEL), int)
+logging.basicConfig(level=LOG_LEVEL if LOG_LEVEL_VALID else logging.INFO)
 logger = logging.getLogger(__name__)
+if not LOG_LEVEL_VALID:
+    logger.warning("Unknown LOG_LEVEL %r, using INFO", LOG_LEVEL)
 
 # Salesforce API configuration
 SALESFORCE_API_VERSION = "v58.0"
 
+# Outbound timeouts, built once and shared by every call. A short connect
+# timeout fails fast when Salesforce is unreachable instead of pinning a worker.
+SF_CONNECT_TIMEOUT = float(os.environ.get('SF_CONNECT_TIMEOUT', 3.05))
+SF_READ_TIMEOUT = float(os.environ.get('SF_READ_TIMEOUT', 27))
+SF_VALIDATE_READ_TIMEOUT = float(os.environ.get('SF_VALIDATE_READ_TIMEOUT', 12))
+SF_TIMEOUT = Timeout(connect=SF_CONNECT_TIMEOUT, read=SF_READ_TIMEOUT)
+SF_VALIDATE_TIMEOUT = Timeout(connect=SF_CONNECT_TIMEOUT, read=SF_VALIDATE_READ_TIMEOUT)
+
+# In-memory cache for Salesforce describe responses
+# Describe metadata changes rarely and is shared per org and object. Record
+# reads are not cached: the cache is per process, so a write handled by one
+# worker, or sent through /api/proxy, could not reliably evict another copy.
+# Describe entries are (body, last_modified, etag, expires_at, version) and
+# are kept past expiry so they can be revalidated with a conditional request,
+# so the cache is bounded by the total size of the bodies it holds.
+# A describe reflects the user's field-level security, so a session is only
+# served an entry once Salesforce has confirmed that version for it, either
+# by returning it or with a 304. DESCRIBE_SESSIONS maps each session to the
+# version it was confirmed for.
+DESCRIBE_TTL = 900
+DESCRIBE_CACHE_MAX_BYTES = int(os.environ.get('DESCRIBE_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+DESCRIBE_CACHE = LRUCache(maxsize=DESCRIBE_CACHE_MAX_BYTES, getsizeof=lambda entry: len(entry[0]))
+DESCRIBE_SESSIONS = TTLCache(maxsize=8192, ttl=DESCRIBE_TTL)
+DESCRIBE_VERSIONS = itertools.count(1)
+DESCRIBE_STATS = {"hit": 0, "miss": 0, "not_modified": 0}
+CACHE_LOCK = threading.RLock()
+
+# Outbound calls currently in flight, so identical concurrent requests
+# share a single Salesforce round-trip instead of each making their own.
+# The first caller makes the call itself and publishes it through a Future.
+# Joiners wait on it without a timeout of their own: the leader's call is
+# bounded by the same SF_TIMEOUT and retry policy as if they had made it.
+INFLIGHT = {}
+INFLIGHT_LOCK = threading.Lock()
+
+# Objects of a single batch describe request fetched from Salesforce at once,
+# each request gets its own pool so one large batch never holds up another
+BATCH_CONCURRENCY = 16
+BATCH_MAX_OBJECTS = 100
+
+# Shared HTTP session so connections to Salesforce are pooled and kept alive.
+# The pool holds one connection per request a gevent worker can have in
+# flight, otherwise connections beyond it are closed after a single use.
+SF_POOL_MAXSIZE = int(os.environ.get('WORKER_CONNECTIONS', 1000))
+SF_SESSION = requests.Session()
+SF_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=SF_POOL_MAXSIZE,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=[502, 503, 504],
+        raise_on_status=False
+    )
+))
+SF_SESSION.headers.update({'Accept-Encoding': 'gzip'})
+
+# HTTP method dispatch for proxied calls, and the methods that carry a JSON body
+SF_METHODS = {
+    'GET': SF_SESSION.get,
+    'POST': SF_SESSION.post,
+    'PUT': SF_SESSION.put,
+    'PATCH': SF_SESSION.patch,
+    'DELETE': SF_SESSION.delete
+}
+BODY_METHODS = frozenset(['POST', 'PUT', 'PATCH'])
+
+# Chunk size used when streaming Salesforce responses back to the client
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Record count at the head of a SOQL query response, read without parsing the body
+TOTAL_SIZE_RE = re.compile(rb'"totalSize"\s*:\s*(\d+)')
+
+# Shape of an sObject API name, so a name can never reach past the describe URL
+OBJECT_NAME_RE = re.compile(r'\w+', re.ASCII)
+
+# Prebuilt error responses shared by every proxy route
+JSON_HEADERS = {'Content-Type': 'application/json'}
+ERR_TIMEOUT = (orjson.dumps({"error": "Request timeout"}), 504, JSON_HEADERS)
+ERR_MISSING_VALIDATE_FIELDS = (orjson.dumps({
+    "valid": False,
+    "error": "Missing required fields: instanceUrl, sessionId"
+}), 400, JSON_HEADERS)
+ERR_MISSING_QUERY_FIELDS = (orjson.dumps({"error": "Missing required fields: query, instanceUrl, sessionId"}), 400, JSON_HEADERS)
+ERR_MISSING_SESSION_FIELDS = (orjson.dumps({"error": "Missing required fields: instanceUrl, sessionId"}), 400, JSON_HEADERS)
+ERR_MISSING_BATCH_FIELDS = (orjson.dumps({"error": "Missing required fields: instanceUrl, sessionId, objects"}), 400, JSON_HEADERS)
+ERR_INVALID_OBJECT_NAME = (orjson.dumps({"error": "Invalid object name"}), 400, JSON_HEADERS)
+ERR_TOO_MANY_BATCH_OBJECTS = (orjson.dumps({"error": f"Too many objects: at most {BATCH_MAX_OBJECTS} per batch"}), 400, JSON_HEADERS)
+ERR_MISSING_RECORD_FIELDS = (orjson.dumps({"error": "Missing required fields: instanceUrl, sessionId, recordData"}), 400, JSON_HEADERS)
+ERR_MISSING_PROXY_FIELDS = (orjson.dumps({"error": "Missing required fields: instance_url, endpoint, auth_token"}), 400, JSON_HEADERS)
+
+# CORS preflight reply, browsers may cache it for a day
+PREFLIGHT_BODY = orjson.dumps({"status": "ok"})
+PREFLIGHT_HEADERS = (
+    ('Access-Control-Allow-Origin', '*'),
+    ('Access-Control-Allow-Headers', 'Content-Type,Authorization,X-Requested-With'),
+    ('Access-Control-Allow-Methods', 'GET,POST,PUT,DELETE,OPTIONS,PATCH'),
+    ('Access-Control-Max-Age', '86400')
+)
+
+def ojsonify(obj, status=200):
+    """Serialize obj with orjson into a JSON response"""
+    return app.response_class(
+        orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS),
+        status=status,
+        mimetype='application/json'
+    )
+
+@lru_cache(maxsize=2048)
+def sf_headers(session_id):
+    """Build the Salesforce request headers for a session once and reuse them"""
+    return (
+        ('Authorization', f'Bearer {session_id}'),
+        ('Content-Type', 'application/json'),
+        ('Accept', 'application/json')
+    )
+
+def instance_root(instance_url):
+    """Normalize an instance URL so cache keys match the URLs sf_prefix builds"""
+    return instance_url.rstrip('/')
+
+@lru_cache(maxsize=256)
+def sf_prefix(instance_url):
+    """Build the versioned REST API prefix for a Salesforce instance once and reuse it"""
+    return f"{instance_root(instance_url)}/services/data/{SALESFORCE_API_VERSION}"
+
+def single_flight(key, fn, *args):
+    """Run fn once for all concurrent callers with the same key and hand each the result"""
+    with INFLIGHT_LOCK:
+        future = INFLIGHT.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = INFLIGHT[key] = Future()
+    if not is_leader:
+        return future.result()
+    try:
+        result = fn(*args)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with INFLIGHT_LOCK:
+            INFLIGHT.pop(key, None)
+
+def sf_route(fn):
+    """Wrap a proxy route with the shared handling for failed Salesforce calls"""
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        except requests.exceptions.Timeout:
+            logger.error("Request timeout")
+            return ERR_TIMEOUT
+        except requests.exceptions.ProxyError as e:
+            logger.error("Proxy error - PythonAnywhere free tier restriction: %s", e)
+            return ojsonify({
+                "error": "External API access restricted",
+                "message": "PythonAnywhere free tier doesn't allow external HTTPS requests to Salesforce. You need to upgrade to a paid plan.",
+                "details": str(e),
+                "solution": "Upgrade to PythonAnywhere Hacker plan ($5/month) to enable external API calls"
+            }), 403
+        except requests.exceptions.RequestException as e:
+            logger.error("Request error: %s", e)
+            return ojsonify({"error": f"Request error: {str(e)}"}), 500
+        except Exception as e:
+            logger.error("Unexpected error in %s: %s", fn.__name__, e)
+            return ojsonify({"error": f"Internal server error: {str(e)}"}), 500
+    return wrapper
+
+def get_request_json():
+    """Parse the request body with orjson, returning {} unless it is a JSON object"""
+    try:
+        data = orjson.loads(request.get_data())
+    except orjson.JSONDecodeError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+def non_empty_strings(*values):
+    """Check that every required field is a non-empty string"""
+    return all(isinstance(value, str) and value for value in values)
+
 @app.route('/', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify({
+    return ojsonify({
         "status": "healthy",
         "service": "Salesforce API Proxy",
         "version": "1.0.0",
         "endpoints": [
             "/api/query",
             "/api/describe/<object_name>",
+            "/api/describe/batch",
             "/api/sobjects/<object_name>",
             "/api/sobjects/<object_name>/<record_id>",
-            "/api/proxy"
+            "/api/proxy",
+            "/api/cache/invalidate"
         ]
     })
 
@@ -43,13 +261,14 @@ def health_check():
 def debug_info():
     """Debug endpoint to check app status"""
     import sys
-    return jsonify({
+    return ojsonify({
         "status": "Flask app is running",
         "python_version": sys.version,
         "flask_version": app.__class__.__module__,
         "registered_routes": [str(rule) for rule in app.url_map.iter_rules()],
         "request_method": "GET",
-        "cors_enabled": True
+        "cors_enabled": True,
+        "describe_cache": dict(DESCRIBE_STATS, entries=len(DESCRIBE_CACHE), bytes=DESCRIBE_CACHE.currsize)
     })
 
 @app.route('/api/validate-session', methods=['POST', 'OPTIONS'])
@@ -59,36 +278,29 @@ def validate_session():
         return handle_preflight()
     
     try:
-        data = request.get_json()
-        
-        if not data or 'instanceUrl' not in data or 'sessionId' not in data:
-            return jsonify({
-                "valid": False,
-                "error": "Missing required fields: instanceUrl, sessionId"
-            }), 400
+        data = get_request_json()
+        instance_url = data.get('instanceUrl')
+        session_id = data.get('sessionId')
         
-        instance_url = data['instanceUrl']
-        session_id = data['sessionId']
+        if not non_empty_strings(instance_url, session_id):
+            return ERR_MISSING_VALIDATE_FIELDS
         
         # Test session with a simple query
-        sf_url = f"{instance_url}/services/data/{SALESFORCE_API_VERSION}/query/"
-        headers = {
-            'Authorization': f'Bearer {session_id}',
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        }
+        sf_url = sf_prefix(instance_url) + "/query/"
+        headers = dict(sf_headers(session_id))
         
         # Simple test query
         params = {'q': 'SELECT Id FROM User LIMIT 1'}
         
-        logger.info(f"Validating session for: {instance_url}")
-        logger.info(f"Session ID format: {session_id[:10]}...{session_id[-10:] if len(session_id) > 20 else ''}")
+        logger.info("Validating session for: %s", instance_url)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Session ID format: %s...%s", session_id[:10], session_id[-10:] if len(session_id) > 20 else '')
         
-        response = requests.get(sf_url, headers=headers, params=params, timeout=15)
+        response = SF_SESSION.get(sf_url, headers=headers, params=params, timeout=SF_VALIDATE_TIMEOUT)
         
         if response.status_code == 200:
             result = response.json()
-            return jsonify({
+            return ojsonify({
                 "valid": True,
                 "message": "Session is valid",
                 "test_query_results": result.get('totalSize', 0),
@@ -101,7 +313,7 @@ def validate_session():
         elif response.status_code == 401:
             try:
                 error_data = response.json()
-                return jsonify({
+                return ojsonify({
                     "valid": False,
                     "error": "Invalid or expired session",
                     "salesforce_error": error_data,
@@ -112,433 +324,528 @@ def validate_session():
                     ]
                 })
             except:
-                return jsonify({
+                return ojsonify({
                     "valid": False,
                     "error": "Session validation failed",
                     "response_code": response.status_code
                 })
         else:
-            return jsonify({
+            return ojsonify({
                 "valid": False,
                 "error": f"Unexpected response code: {response.status_code}",
                 "response_text": response.text[:200]
             })
             
     except requests.exceptions.RequestException as e:
-        logger.error(f"Session validation request error: {e}")
-        return jsonify({
+        logger.error("Session validation request error: %s", e)
+        return ojsonify({
             "valid": False,
             "error": "Network error during validation",
             "details": str(e)
         }), 500
     except Exception as e:
-        logger.error(f"Session validation error: {e}")
-        return jsonify({
+        logger.error("Session validation error: %s", e)
+        return ojsonify({
             "valid": False,
             "error": "Validation error",
             "details": str(e)
         }), 500
 
 @app.route('/api/query', methods=['POST', 'OPTIONS'])
+@sf_route
 def proxy_query():
     """Proxy SOQL queries to Salesforce"""
     if request.method == 'OPTIONS':
         return handle_preflight()
     
-    try:
-        data = request.get_json()
-        
-        # Validate required fields
-        if not data or 'query' not in data or 'instanceUrl' not in data or 'sessionId' not in data:
-            return jsonify({
-                "error": "Missing required fields: query, instanceUrl, sessionId"
-            }), 400
-        
-        query = data['query']
-        instance_url = data['instanceUrl']
-        session_id = data['sessionId']
-        
-        # Prepare Salesforce API request
-        sf_url = f"{instance_url}/services/data/{SALESFORCE_API_VERSION}/query/"
-        headers = {
-            'Authorization': f'Bearer {session_id}',
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        }
-        
-        params = {'q': query}
-        
-        logger.info(f"Executing SOQL query: {query[:100]}...")
-        logger.info(f"Target URL: {sf_url}")
-        logger.info(f"Session ID prefix: {session_id[:10]}...")
-        
-        # Make request to Salesforce
+    data = get_request_json()
+    query = data.get('query')
+    instance_url = data.get('instanceUrl')
+    session_id = data.get('sessionId')
+    
+    # Validate required fields
+    if not non_empty_strings(query, instance_url, session_id):
+        return ERR_MISSING_QUERY_FIELDS
+    
+    # Prepare Salesforce API request
+    sf_url = sf_prefix(instance_url) + "/query/"
+    headers = dict(sf_headers(session_id))
+    
+    params = {'q': query}
+    
+    logger.info("Executing SOQL query: %.100s...", query)
+    logger.info("Target URL: %s", sf_url)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Session ID prefix: %s...", session_id[:10])
+    
+    # Make request to Salesforce
+    response = SF_SESSION.get(sf_url, headers=headers, params=params, timeout=SF_TIMEOUT, stream=True)
+    logger.info("Salesforce response status: %s", response.status_code)
+    
+    if response.status_code == 200:
+        # Pass the body straight through without parsing it,
+        # requests has already decoded any gzip from Salesforce
+        chunks = response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
         try:
-            response = requests.get(sf_url, headers=headers, params=params, timeout=30)
-            logger.info(f"Salesforce response status: {response.status_code}")
-        except requests.exceptions.ProxyError as e:
-            logger.error(f"Proxy error - PythonAnywhere free tier restriction: {e}")
-            return jsonify({
-                "error": "External API access restricted",
-                "message": "PythonAnywhere free tier doesn't allow external HTTPS requests to Salesforce. You need to upgrade to a paid plan.",
-                "details": str(e),
-                "solution": "Upgrade to PythonAnywhere Hacker plan ($5/month) to enable external API calls"
-            }), 403
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request error: {e}")
-            return jsonify({
-                "error": "Network error",
-                "message": str(e),
-                "type": type(e).__name__
-            }), 500
-        
-        if response.status_code == 200:
-            result = response.json()
-            logger.info(f"Query successful: {result.get('totalSize', 0)} records returned")
-            return jsonify(result)
-        elif response.status_code == 401:
-            # Handle authentication errors specifically
-            logger.error(f"Authentication failed: {response.text}")
-            try:
-                error_data = response.json()
-                return jsonify({
-                    "error": "Authentication failed",
-                    "status_code": 401,
-                    "salesforce_error": error_data,
-                    "troubleshooting": {
-                        "issue": "Session expired or invalid",
-                        "solutions": [
-                            "Get a fresh session ID from Salesforce browser",
-                            "Open F12 DevTools → Network tab → Look for /services/data/ calls",
-                            "Copy Authorization header value (after 'Bearer ')",
-                            "Use the extension's Debug Session feature to input new session"
-                        ],
-                        "session_info": {
-                            "provided_length": len(session_id),
-                            "first_10_chars": session_id[:10],
-                            "instance_url": instance_url
-                        }
+            first_chunk = next(chunks, b'')
+        except BaseException:
+            response.close()
+            raise
+        if logger.isEnabledFor(logging.INFO):
+            match = TOTAL_SIZE_RE.search(first_chunk, 0, 256)
+            logger.info("Query successful: %d records returned", int(match.group(1)) if match else -1)
+        streamed = Response(itertools.chain((first_chunk,), chunks), mimetype='application/json')
+        # Release the connection when the reply is closed, even if its body is never read
+        streamed.call_on_close(response.close)
+        return streamed
+    elif response.status_code == 401:
+        # Handle authentication errors specifically
+        logger.error("Authentication failed: %s", response.text)
+        try:
+            error_data = response.json()
+            return ojsonify({
+                "error": "Authentication failed",
+                "status_code": 401,
+                "salesforce_error": error_data,
+                "troubleshooting": {
+                    "issue": "Session expired or invalid",
+                    "solutions": [
+                        "Get a fresh session ID from Salesforce browser",
+                        "Open F12 DevTools → Network tab → Look for /services/data/ calls",
+                        "Copy Authorization header value (after 'Bearer ')",
+                        "Use the extension's Debug Session feature to input new session"
+                    ],
+                    "session_info": {
+                        "provided_length": len(session_id),
+                        "first_10_chars": session_id[:10],
+                        "instance_url": instance_url
                     }
-                }), 401
-            except:
-                return jsonify({
-                    "error": "Authentication failed",
-                    "status_code": 401,
-                    "message": "Session expired or invalid",
-                    "raw_response": response.text
-                }), 401
-        else:
-            logger.error(f"Salesforce API error: {response.status_code} - {response.text}")
-            return jsonify({
-                "error": f"Salesforce API error: {response.status_code}",
-                "details": response.text
-            }), response.status_code
-            
-    except requests.exceptions.Timeout:
-        logger.error("Request timeout")
-        return jsonify({"error": "Request timeout"}), 504
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Request error: {str(e)}")
-        return jsonify({"error": f"Request error: {str(e)}"}), 500
-    except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+                }
+            }), 401
+        except:
+            return ojsonify({
+                "error": "Authentication failed",
+                "status_code": 401,
+                "message": "Session expired or invalid",
+                "raw_response": response.text
+            }), 401
+    else:
+        logger.error("Salesforce API error: %s - %s", response.status_code, response.text)
+        return ojsonify({
+            "error": f"Salesforce API error: {response.status_code}",
+            "details": response.text
+        }), response.status_code
+
+def count_describe(outcome, object_name):
+    """Record a describe cache outcome and log the running counters"""
+    with CACHE_LOCK:
+        DESCRIBE_STATS[outcome] += 1
+        stats = dict(DESCRIBE_STATS) if logger.isEnabledFor(logging.INFO) else None
+    if stats is not None:
+        logger.info("Describe cache %s for %s: %s", outcome, object_name, stats)
+
+def store_describe(cache_key, session_key, body, last_modified, etag, version):
+    """Cache a describe body with its validators for another DESCRIBE_TTL seconds, confirmed for the session"""
+    with CACHE_LOCK:
+        try:
+            DESCRIBE_CACHE[cache_key] = (body, last_modified, etag, time.monotonic() + DESCRIBE_TTL, version)
+        except ValueError:
+            # Larger than the whole cache; serve it without keeping it
+            DESCRIBE_CACHE.pop(cache_key, None)
+            return
+        DESCRIBE_SESSIONS[session_key] = version
+
+def describe_object(instance_url, session_id, object_name):
+    """Describe an object, from cache when fresh and otherwise from Salesforce
+    
+    Returns (status_code, body) where body is the raw describe JSON on
+    success and the Salesforce error text otherwise. Identical describes
+    for the same session already in flight are joined rather than repeated.
+    """
+    cache_key = (instance_root(instance_url), object_name)
+    session_key = cache_key + (session_id,)
+    with CACHE_LOCK:
+        entry = DESCRIBE_CACHE.get(cache_key)
+        confirmed = DESCRIBE_SESSIONS.get(session_key)
+    if entry is not None and entry[4] == confirmed and entry[3] > time.monotonic():
+        count_describe("hit", object_name)
+        return 200, entry[0]
+    
+    return single_flight(('describe',) + session_key, fetch_describe, instance_url, session_id, object_name)
+
+def fetch_describe(instance_url, session_id, object_name):
+    """Fetch an object describe from Salesforce, revalidating any cached entry for this session"""
+    cache_key = (instance_root(instance_url), object_name)
+    session_key = cache_key + (session_id,)
+    sf_url = sf_prefix(instance_url) + f"/sobjects/{object_name}/describe/"
+    headers = dict(sf_headers(session_id))
+    
+    # Ask Salesforce to skip the body if our copy is still current for this
+    # session. The ETag covers the body itself, so a 304 for it also shows the
+    # session sees the same fields. Last-Modified only dates the object's
+    # metadata, so it is sent only when this session was served the copy before.
+    with CACHE_LOCK:
+        stale = DESCRIBE_CACHE.get(cache_key)
+        confirmed = DESCRIBE_SESSIONS.get(session_key)
+    if stale is not None:
+        if stale[1] and stale[4] == confirmed:
+            headers['If-Modified-Since'] = stale[1]
+        if stale[2]:
+            headers['If-None-Match'] = stale[2]
+    
+    logger.info("Describing object: %s", object_name)
+    logger.info("Target URL: %s", sf_url)
+    
+    response = SF_SESSION.get(sf_url, headers=headers, timeout=SF_TIMEOUT)
+    logger.info("Salesforce response status: %s", response.status_code)
+    
+    if response.status_code == 304 and stale is not None:
+        # A 304 may carry fresh validators, keep them for the next revalidation
+        store_describe(
+            cache_key,
+            session_key,
+            stale[0],
+            response.headers.get('Last-Modified') or stale[1],
+            response.headers.get('ETag') or stale[2],
+            stale[4]
+        )
+        count_describe("not_modified", object_name)
+        return 200, stale[0]
+    
+    if response.status_code != 200:
+        logger.error("Salesforce API error: %s - %s", response.status_code, response.text)
+        return response.status_code, response.text
+    
+    body = response.content
+    logger.info("Describe successful for %s: %d bytes", object_name, len(body))
+    if stale is not None and stale[0] == body:
+        # Same describe as cached, so sessions confirmed for it stay confirmed
+        body, version = stale[0], stale[4]
+    else:
+        version = next(DESCRIBE_VERSIONS)
+    store_describe(cache_key, session_key, body, response.headers.get('Last-Modified'), response.headers.get('ETag'), version)
+    count_describe("miss", object_name)
+    return 200, body
 
 @app.route('/api/describe/<object_name>', methods=['POST', 'OPTIONS'])
+@sf_route
 def proxy_describe(object_name):
     """Proxy object describe calls to Salesforce"""
     if request.method == 'OPTIONS':
         return handle_preflight()
     
+    data = get_request_json()
+    instance_url = data.get('instanceUrl')
+    session_id = data.get('sessionId')
+    
+    # Validate required fields
+    if not non_empty_strings(instance_url, session_id):
+        return ERR_MISSING_SESSION_FIELDS
+    if not OBJECT_NAME_RE.fullmatch(object_name):
+        return ERR_INVALID_OBJECT_NAME
+    
+    # Serve from cache or make request to Salesforce
+    status_code, body = describe_object(instance_url, session_id, object_name)
+    
+    if status_code == 200:
+        return Response(body, mimetype='application/json')
+    else:
+        return ojsonify({
+            "error": f"Salesforce API error: {status_code}",
+            "details": body
+        }), status_code
+
+@app.route('/api/describe/batch', methods=['POST', 'OPTIONS'])
+@sf_route
+def proxy_describe_batch():
+    """Describe several objects in one call, fetching them from Salesforce concurrently"""
+    if request.method == 'OPTIONS':
+        return handle_preflight()
+    
+    data = get_request_json()
+    instance_url = data.get('instanceUrl')
+    session_id = data.get('sessionId')
+    objects = data.get('objects')
+    
+    # Validate required fields
+    if not (non_empty_strings(instance_url, session_id) and isinstance(objects, list) and objects) or \
+            not all(isinstance(name, str) and OBJECT_NAME_RE.fullmatch(name) for name in objects):
+        return ERR_MISSING_BATCH_FIELDS
+    if len(objects) > BATCH_MAX_OBJECTS:
+        return ERR_TOO_MANY_BATCH_OBJECTS
+    
+    logger.info("Describing %d objects in batch", len(objects))
+    
+    # Each object goes through the same cached, single-flighted path as /api/describe
+    parts = Pool(BATCH_CONCURRENCY).map(
+        lambda name: describe_batch_entry(instance_url, session_id, name),
+        dict.fromkeys(objects)
+    )
+    
+    return Response(b'{"results":{' + b','.join(parts) + b'}}', mimetype='application/json')
+
+def describe_batch_entry(instance_url, session_id, object_name):
+    """Describe one object of a batch as its raw "name": body member of the reply
+    
+    The describe body is spliced in rather than parsed, and a failure only
+    affects its own object, never the rest of the batch.
+    """
     try:
-        data = request.get_json()
-        
-        # Validate required fields
-        if not data or 'instanceUrl' not in data or 'sessionId' not in data:
-            return jsonify({
-                "error": "Missing required fields: instanceUrl, sessionId"
-            }), 400
-        
-        instance_url = data['instanceUrl']
-        session_id = data['sessionId']
-        
-        # Prepare Salesforce API request
-        sf_url = f"{instance_url}/services/data/{SALESFORCE_API_VERSION}/sobjects/{object_name}/describe/"
-        headers = {
-            'Authorization': f'Bearer {session_id}',
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        }
-        
-        logger.info(f"Describing object: {object_name}")
-        logger.info(f"Target URL: {sf_url}")
-        
-        # Make request to Salesforce
-        try:
-            response = requests.get(sf_url, headers=headers, timeout=30)
-            logger.info(f"Salesforce response status: {response.status_code}")
-        except requests.exceptions.ProxyError as e:
-            logger.error(f"Proxy error - PythonAnywhere free tier restriction: {e}")
-            return jsonify({
-                "error": "External API access restricted",
-                "message": "PythonAnywhere free tier doesn't allow external HTTPS requests to Salesforce. You need to upgrade to a paid plan.",
-                "details": str(e),
-                "solution": "Upgrade to PythonAnywhere Hacker plan ($5/month) to enable external API calls"
-            }), 403
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request error: {e}")
-            return jsonify({
-                "error": "Network error",
-                "message": str(e),
-                "type": type(e).__name__
-            }), 500
-        
-        if response.status_code == 200:
-            result = response.json()
-            logger.info(f"Describe successful for {object_name}: {len(result.get('fields', []))} fields")
-            return jsonify(result)
-        else:
-            logger.error(f"Salesforce API error: {response.status_code} - {response.text}")
-            return jsonify({
-                "error": f"Salesforce API error: {response.status_code}",
-                "details": response.text
-            }), response.status_code
-            
+        status_code, body = describe_object(instance_url, session_id, object_name)
+        if status_code != 200:
+            body = orjson.dumps({"error": f"Salesforce API error: {status_code}", "details": body})
     except requests.exceptions.Timeout:
-        logger.error("Request timeout")
-        return jsonify({"error": "Request timeout"}), 504
+        body = orjson.dumps({"error": "Request timeout"})
     except requests.exceptions.RequestException as e:
-        logger.error(f"Request error: {str(e)}")
-        return jsonify({"error": f"Request error: {str(e)}"}), 500
+        logger.error("Request error describing %s: %s", object_name, e)
+        body = orjson.dumps({"error": f"Request error: {str(e)}"})
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+        logger.error("Unexpected error describing %s: %s", object_name, e)
+        body = orjson.dumps({"error": f"Internal server error: {str(e)}"})
+    return orjson.dumps(object_name) + b':' + body
 
 @app.route('/api/sobjects/<object_name>', methods=['POST', 'OPTIONS'])
+@sf_route
 def proxy_create_record(object_name):
     """Proxy record creation to Salesforce"""
     if request.method == 'OPTIONS':
         return handle_preflight()
     
-    try:
-        data = request.get_json()
-        
-        # Validate required fields
-        if not data or 'instanceUrl' not in data or 'sessionId' not in data or 'recordData' not in data:
-            return jsonify({
-                "error": "Missing required fields: instanceUrl, sessionId, recordData"
-            }), 400
-        
-        instance_url = data['instanceUrl']
-        session_id = data['sessionId']
-        record_data = data['recordData']
-        
-        # Prepare Salesforce API request
-        sf_url = f"{instance_url}/services/data/{SALESFORCE_API_VERSION}/sobjects/{object_name}/"
-        headers = {
-            'Authorization': f'Bearer {session_id}',
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        }
-        
-        logger.info(f"Creating record in {object_name}")
-        
-        # Make request to Salesforce
-        response = requests.post(sf_url, headers=headers, json=record_data, timeout=30)
-        
-        if response.status_code in [200, 201]:
-            result = response.json()
-            logger.info(f"Record created successfully: {result.get('id')}")
-            return jsonify(result)
-        else:
-            logger.error(f"Salesforce API error: {response.status_code} - {response.text}")
-            return jsonify({
-                "error": f"Salesforce API error: {response.status_code}",
-                "details": response.text
-            }), response.status_code
-            
-    except requests.exceptions.Timeout:
-        logger.error("Request timeout")
-        return jsonify({"error": "Request timeout"}), 504
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Request error: {str(e)}")
-        return jsonify({"error": f"Request error: {str(e)}"}), 500
-    except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+    data = get_request_json()
+    instance_url = data.get('instanceUrl')
+    session_id = data.get('sessionId')
+    record_data = data.get('recordData')
+    
+    # Validate required fields
+    if not non_empty_strings(instance_url, session_id) or record_data is None:
+        return ERR_MISSING_RECORD_FIELDS
+    
+    # Prepare Salesforce API request
+    sf_url = sf_prefix(instance_url) + f"/sobjects/{object_name}/"
+    headers = dict(sf_headers(session_id))
+    
+    logger.info("Creating record in %s", object_name)
+    
+    # Make request to Salesforce
+    response = SF_SESSION.post(sf_url, headers=headers, json=record_data, timeout=SF_TIMEOUT)
+    
+    if response.status_code in [200, 201]:
+        result = response.json()
+        logger.info("Record created successfully: %s", result.get('id'))
+        return ojsonify(result)
+    else:
+        logger.error("Salesforce API error: %s - %s", response.status_code, response.text)
+        return ojsonify({
+            "error": f"Salesforce API error: {response.status_code}",
+            "details": response.text
+        }), response.status_code
 
 @app.route('/api/sobjects/<object_name>/<record_id>', methods=['GET', 'PATCH', 'DELETE', 'OPTIONS'])
+@sf_route
 def proxy_record_operations(object_name, record_id):
     """Proxy record operations (get, update, delete) to Salesforce"""
     if request.method == 'OPTIONS':
         return handle_preflight()
     
-    try:
-        data = request.get_json() or {}
-        
-        # Validate required fields
-        if 'instanceUrl' not in data or 'sessionId' not in data:
-            return jsonify({
-                "error": "Missing required fields: instanceUrl, sessionId"
-            }), 400
-        
-        instance_url = data['instanceUrl']
-        session_id = data['sessionId']
-        
-        # Prepare Salesforce API request
-        sf_url = f"{instance_url}/services/data/{SALESFORCE_API_VERSION}/sobjects/{object_name}/{record_id}"
-        headers = {
-            'Authorization': f'Bearer {session_id}',
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        }
-        
-        logger.info(f"{request.method} operation on {object_name} record: {record_id}")
-        
-        # Make request to Salesforce based on HTTP method
-        if request.method == 'GET':
-            response = requests.get(sf_url, headers=headers, timeout=30)
-        elif request.method == 'PATCH':
-            record_data = data.get('recordData', {})
-            response = requests.patch(sf_url, headers=headers, json=record_data, timeout=30)
-        elif request.method == 'DELETE':
-            response = requests.delete(sf_url, headers=headers, timeout=30)
-        
-        if response.status_code in [200, 204]:
-            if response.content:
-                result = response.json()
-                logger.info(f"Operation successful")
-                return jsonify(result)
-            else:
-                return jsonify({"success": True})
+    data = get_request_json()
+    instance_url = data.get('instanceUrl')
+    session_id = data.get('sessionId')
+    
+    # Validate required fields
+    if not non_empty_strings(instance_url, session_id):
+        return ERR_MISSING_SESSION_FIELDS
+    
+    # Prepare Salesforce API request
+    sf_url = sf_prefix(instance_url) + f"/sobjects/{object_name}/{record_id}"
+    headers = dict(sf_headers(session_id))
+    
+    method = request.method
+    logger.info("%s operation on %s record: %s", method, object_name, record_id)
+    
+    # Make request to Salesforce based on HTTP method
+    record_data = data.get('recordData', {}) if method in BODY_METHODS else None
+    response = SF_METHODS[method](sf_url, headers=headers, json=record_data, timeout=SF_TIMEOUT)
+    
+    if response.status_code in [200, 204]:
+        if response.content:
+            result = response.json()
+            logger.info("Operation successful")
+            return ojsonify(result)
         else:
-            logger.error(f"Salesforce API error: {response.status_code} - {response.text}")
-            return jsonify({
-                "error": f"Salesforce API error: {response.status_code}",
-                "details": response.text
-            }), response.status_code
-            
-    except requests.exceptions.Timeout:
-        logger.error("Request timeout")
-        return jsonify({"error": "Request timeout"}), 504
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Request error: {str(e)}")
-        return jsonify({"error": f"Request error: {str(e)}"}), 500
-    except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+            return ojsonify({"success": True})
+    else:
+        logger.error("Salesforce API error: %s - %s", response.status_code, response.text)
+        return ojsonify({
+            "error": f"Salesforce API error: {response.status_code}",
+            "details": response.text
+        }), response.status_code
+
+@app.route('/api/cache/invalidate', methods=['POST', 'OPTIONS'])
+@sf_route
+def invalidate_cache():
+    """Drop cached describe responses for an instance, optionally for one object"""
+    if request.method == 'OPTIONS':
+        return handle_preflight()
+    
+    data = get_request_json()
+    instance_url = data.get('instanceUrl')
+    session_id = data.get('sessionId')
+    object_name = data.get('objectName')
+    
+    # Validate required fields
+    if not non_empty_strings(instance_url, session_id):
+        return ERR_MISSING_SESSION_FIELDS
+    
+    # Only callers with a live session for the instance may flush its entries
+    response = SF_SESSION.get(sf_prefix(instance_url) + "/", headers=dict(sf_headers(session_id)), timeout=SF_VALIDATE_TIMEOUT)
+    if response.status_code != 200:
+        logger.error("Cache invalidation rejected: %s", response.status_code)
+        return ojsonify({
+            "error": f"Salesforce API error: {response.status_code}",
+            "details": response.text
+        }), response.status_code
+    
+    instance_url = instance_root(instance_url)
+    
+    def matches(key):
+        return key[0] == instance_url and (object_name is None or key[1] == object_name)
+    
+    with CACHE_LOCK:
+        stale = [key for key in DESCRIBE_CACHE.keys() if matches(key)]
+        for key in stale:
+            DESCRIBE_CACHE.pop(key, None)
+    removed = len(stale)
+    
+    logger.info("Invalidated %d cache entries", removed)
+    return ojsonify({"success": True, "invalidated": removed})
 
 def handle_preflight():
     """Handle CORS preflight requests"""
-    response = jsonify({"status": "ok"})
-    response.headers.add("Access-Control-Allow-Origin", "*")
-    response.headers.add("Access-Control-Allow-Headers", "Content-Type,Authorization,X-Requested-With")
-    response.headers.add("Access-Control-Allow-Methods", "GET,POST,PUT,DELETE,OPTIONS,PATCH")
-    response.headers.add("Access-Control-Max-Age", "3600")
-    return response
+    # A fresh Response per call, after_request hooks modify the response they are given
+    return Response(PREFLIGHT_BODY, status=200, mimetype='application/json', headers=PREFLIGHT_HEADERS)
+
+# Error handler bodies are static, encode them once
+NOT_FOUND_BODY = orjson.dumps({
+    "error": "Endpoint not found",
+    "available_endpoints": [
+        "GET / - Health check",
+        "POST /api/query - Execute SOQL query",
+        "POST /api/describe/<object_name> - Get object metadata",
+        "POST /api/describe/batch - Get metadata for several objects at once",
+        "POST /api/sobjects/<object_name> - Create record",
+        "GET /api/sobjects/<object_name>/<record_id> - Get record",
+        "PATCH /api/sobjects/<object_name>/<record_id> - Update record",
+        "DELETE /api/sobjects/<object_name>/<record_id> - Delete record",
+        "POST /api/proxy - General proxy for any Salesforce API call",
+        "POST /api/cache/invalidate - Drop cached describe responses for an instance"
+    ]
+})
+INTERNAL_ERROR_BODY = orjson.dumps({
+    "error": "Internal server error",
+    "message": "Please check the server logs for more details"
+})
 
 @app.errorhandler(404)
 def not_found(error):
-    return jsonify({
-        "error": "Endpoint not found",
-        "available_endpoints": [
-            "GET / - Health check",
-            "POST /api/query - Execute SOQL query",
-            "POST /api/describe/<object_name> - Get object metadata",
-            "POST /api/sobjects/<object_name> - Create record",
-            "GET /api/sobjects/<object_name>/<record_id> - Get record",
-            "PATCH /api/sobjects/<object_name>/<record_id> - Update record",
-            "DELETE /api/sobjects/<object_name>/<record_id> - Delete record",
-            "POST /api/proxy - General proxy for any Salesforce API call"
-        ]
-    }), 404
+    return Response(NOT_FOUND_BODY, status=404, mimetype='application/json')
 
 @app.route('/api/proxy', methods=['POST', 'OPTIONS'])
+@sf_route
 def general_proxy():
     """General proxy endpoint for any Salesforce API call"""
     if request.method == 'OPTIONS':
         return handle_preflight()
     
-    try:
-        data = request.get_json()
-        
-        # Validate required fields
-        required_fields = ['instance_url', 'endpoint', 'auth_token']
-        if not data or not all(field in data for field in required_fields):
-            return jsonify({
-                "error": f"Missing required fields: {', '.join(required_fields)}"
-            }), 400
-        
-        instance_url = data['instance_url']
-        endpoint = data['endpoint']
-        auth_token = data['auth_token']
-        method = data.get('method', 'GET').upper()
-        body = data.get('body')
-        
-        # Prepare headers
-        headers = {
-            'Authorization': f'Bearer {auth_token}',
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        }
-        
-        # Construct full URL
-        url = f"{instance_url.rstrip('/')}{endpoint}"
-        
-        logger.info(f"Proxying {method} request to: {url}")
-        
-        # Make the request
-        if method == 'GET':
-            response = requests.get(url, headers=headers, timeout=30)
-        elif method == 'POST':
-            response = requests.post(url, headers=headers, json=body, timeout=30)
-        elif method == 'PUT':
-            response = requests.put(url, headers=headers, json=body, timeout=30)
-        elif method == 'DELETE':
-            response = requests.delete(url, headers=headers, timeout=30)
-        else:
-            return jsonify({"error": f"Unsupported HTTP method: {method}"}), 400
-        
-        # Handle response
-        if response.status_code == 200 or response.status_code == 201:
-            try:
-                return jsonify(response.json())
-            except ValueError:
-                return response.text
-        else:
-            logger.error(f"Salesforce API error: {response.status_code} - {response.text}")
-            try:
-                error_data = response.json()
-                return jsonify({
-                    "error": "Salesforce API error",
-                    "status_code": response.status_code,
-                    "details": error_data
-                }), response.status_code
-            except ValueError:
-                return jsonify({
-                    "error": "Salesforce API error",
-                    "status_code": response.status_code,
-                    "message": response.text
-                }), response.status_code
-                
-    except requests.exceptions.Timeout:
-        logger.error("Request timeout")
-        return jsonify({"error": "Request timeout"}), 408
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Request error: {e}")
-        return jsonify({"error": f"Request failed: {str(e)}"}), 500
-    except Exception as e:
-        logger.error(f"Unexpected error in general_proxy: {e}")
-        return jsonify({"error": f"Unexpected error: {str(e)}"}), 500
+    data = get_request_json()
+    instance_url = data.get('instance_url')
+    endpoint = data.get('endpoint')
+    auth_token = data.get('auth_token')
+    
+    # Validate required fields
+    if not non_empty_strings(instance_url, endpoint, auth_token):
+        return ERR_MISSING_PROXY_FIELDS
+    
+    method = str(data.get('method', 'GET')).upper()
+    body = data.get('body')
+    
+    # Prepare headers
+    headers = dict(sf_headers(auth_token))
+    
+    # Construct full URL
+    url = f"{instance_url.rstrip('/')}{endpoint}"
+    
+    logger.info("Proxying %s request to: %s", method, url)
+    
+    # Make the request
+    send = SF_METHODS.get(method)
+    if send is None:
+        return ojsonify({"error": f"Unsupported HTTP method: {method}"}), 400
+    response = send(url, headers=headers, json=body if method in BODY_METHODS else None, timeout=SF_TIMEOUT)
+    
+    # Handle response
+    if response.status_code == 200 or response.status_code == 201:
+        return Response(
+            response.content,
+            status=response.status_code,
+            content_type=response.headers.get('Content-Type', 'application/json')
+        )
+    else:
+        logger.error("Salesforce API error: %s - %s", response.status_code, response.text)
+        try:
+            error_data = response.json()
+            return ojsonify({
+                "error": "Salesforce API error",
+                "status_code": response.status_code,
+                "details": error_data
+            }), response.status_code
+        except ValueError:
+            return ojsonify({
+                "error": "Salesforce API error",
+                "status_code": response.status_code,
+                "message": response.text
+            }), response.status_code
+
+def warm_describe_cache(instance_url, session_id, object_names):
+    """Describe common objects ahead of time so the first user requests only need a 304 revalidation"""
+    for name in object_names:
+        try:
+            status_code, _ = describe_object(instance_url, session_id, name)
+        except Exception as e:
+            logger.warning("Describe cache warm-up failed for %s: %s", name, e)
+            continue
+        if status_code in (401, 403):
+            # Stale or unauthorised warm-up session, the rest would fail the same way
+            logger.info("Skipping describe cache warm-up, session rejected with %s", status_code)
+            return
+    logger.info("Describe cache warmed for %d objects", len(object_names))
+
+# Optionally prewarm the describe cache in the background at startup.
+# Other sessions are served a warmed body only after Salesforce answers
+# their conditional request with a 304, so they never get the warm-up
+# user's field-level view unless it is also theirs.
+SF_WARM_INSTANCE = os.environ.get('SF_WARM_INSTANCE')
+SF_WARM_SESSION = os.environ.get('SF_WARM_SESSION')
+SF_WARM_OBJECTS = [
+    name.strip()
+    for name in os.environ.get('SF_WARM_OBJECTS', 'Account,Contact,Opportunity,Lead,Case,User').split(',')
+    if name.strip()
+]
+if SF_WARM_INSTANCE and SF_WARM_SESSION:
+    threading.Thread(
+        target=warm_describe_cache,
+        args=(SF_WARM_INSTANCE, SF_WARM_SESSION, SF_WARM_OBJECTS),
+        daemon=True
+    ).start()
 
 @app.errorhandler(500)
 def internal_error(error):
-    return jsonify({
-        "error": "Internal server error",
-        "message": "Please check the server logs for more details"
-    }), 500
+    return Response(INTERNAL_ERROR_BODY, status=500, mimetype='application/json')
 
 if __name__ == '__main__':
-    # For local development
-    port = int(os.environ.get('PORT', 5000))
-    app.run(debug=False, host='0.0.0.0', port=port)
+    # For local development only, production runs under gunicorn:
+    #   gunicorn -c gunicorn_conf.py salesforce_api_proxy:app
+    if os.environ.get('DEV'):
+        port = int(os.environ.get('PORT', 5000))
+        app.run(debug=False, host='0.0.0.0', port=port)
+    else:
+        logger.warning("Set DEV=1 to use the development server, or run: gunicorn -c gunicorn_conf.py salesforce_api_proxy:app")